@@ -1,6 +1,6 @@
 """Timeout decorator tests."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from timeoutd.converters import time_to_seconds
 
@@ -19,6 +19,12 @@ def test_converters_time_to_seconds_only_limit_datetime():
     assert 1 == round(time_to_seconds(datetime.now() + timedelta(seconds=1)), 4)
 
 
+def test_converters_time_to_seconds_only_limit_aware_datetime():
+    assert 1 == round(
+        time_to_seconds(datetime.now(timezone.utc) + timedelta(seconds=1)), 4
+    )
+
+
 def test_converters_time_to_seconds_only_limit_timedelta():
     assert 7.12 == time_to_seconds(timedelta(seconds=7.12))
 
@@ -47,3 +53,7 @@ def test_converters_time_to_seconds_minutes_and_hours():
     assert 15 + 3 * 60 + 45 * 60 + 1 * 60 * 60 == time_to_seconds(
         minutes=3.25, hours=1.75
     )
+
+
+def test_converters_time_to_seconds_limit_and_seconds():
+    assert 3 == time_to_seconds(3, seconds=4.2, minutes=1)
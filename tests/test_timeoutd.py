@@ -1,7 +1,12 @@
 """Timeout decorator tests."""
 
+import multiprocessing
+import os
+import signal
+import sys
 import time
 from datetime import datetime, timedelta
+from functools import partial
 
 import pytest
 
@@ -11,9 +16,9 @@ TIMEOUT = 0.1
 EXCEPTION_MESSAGE = "Timeout exceeded."
 
 
-@pytest.fixture(params=[False, True])
+@pytest.fixture(params=[False, True, "thread"])
 def use_signals(request):
-    """Use signals for timing out or not."""
+    """Use signals, multiprocessing, or threads for timing out."""
     return request.param
 
 
@@ -63,6 +68,43 @@ def test_timeout_kwargs_with_initial_timeout_none(use_signals):
         f(timeout=0.1)
 
 
+def test_timeout_kwargs_only_apply_to_single_call(use_signals):
+    @timeout(seconds=0.3, use_signals=use_signals)
+    def f():
+        time.sleep(0.2)
+
+    with pytest.raises(TimeoutError):
+        f(timeout=0.1)
+    f()
+
+
+def test_timeout_no_override_passes_kwargs(use_signals):
+    @timeout(seconds=TIMEOUT, use_signals=use_signals, allow_override=False)
+    def f(timeout):
+        return timeout
+
+    assert f(timeout=5) == 5
+
+
+def test_timeout_no_override(use_signals):
+    @timeout(seconds=TIMEOUT, use_signals=use_signals, allow_override=False)
+    def f(**kwargs):
+        time.sleep(0.2)
+
+    with pytest.raises(TimeoutError):
+        f(timeout=0.3)
+
+
+def test_timeout_kwargs_restores_signal_handler():
+    @timeout()
+    def f():
+        pass
+
+    old_handler = signal.getsignal(signal.SIGALRM)
+    f(timeout=0.1)
+    assert signal.getsignal(signal.SIGALRM) is old_handler
+
+
 def test_timeout_no_seconds(use_signals):
     @timeout(use_signals=use_signals)
     def f():
@@ -183,6 +225,41 @@ def test_function_name(use_signals):
     assert func_name.__name__ == "func_name"
 
 
+def test_function_attributes_with_retries(use_signals):
+    def func_name():
+        """Docstring."""
+
+    func_name.marker = True
+    wrapped = timeout(seconds=0.2, use_signals=use_signals, retries=1)(func_name)
+
+    assert wrapped.__name__ == "func_name"
+    assert wrapped.__doc__ == "Docstring."
+    assert wrapped.__module__ == __name__
+    assert wrapped.marker
+    assert wrapped.__wrapped__ is func_name
+
+
+def test_timeout_partial(use_signals):
+    def f(i, j):
+        return i + j
+
+    wrapped = timeout(seconds=TIMEOUT, use_signals=use_signals)(partial(f, 1))
+
+    assert wrapped(2) == 3
+    assert wrapped.__wrapped__.func is f
+
+
+def test_timeout_retries_with_on_timeout_args(use_signals):
+    @timeout(
+        seconds=TIMEOUT, use_signals=use_signals, retries=1, on_timeout_args=(0.0,)
+    )
+    def f(delay):
+        time.sleep(delay)
+        return delay
+
+    assert f(0.2) == 0.0
+
+
 def test_timeout_custom_on_timeout(use_signals):
     def on_timeout():
         return 0
@@ -194,6 +271,29 @@ def test_timeout_custom_on_timeout(use_signals):
     assert f() == 0
 
 
+def test_timeout_kwargs_custom_on_timeout_with_args(use_signals):
+    def on_timeout(i, j):
+        return i + j
+
+    @timeout(use_signals=use_signals, on_timeout=on_timeout, on_timeout_args=(1, 2))
+    def f():
+        time.sleep(0.2)
+
+    assert f(timeout=TIMEOUT) == 3
+
+
+def test_timeout_on_timeout_is_not_timed_out(use_signals):
+    def on_timeout():
+        time.sleep(2 * TIMEOUT)
+        return 0
+
+    @timeout(seconds=TIMEOUT, on_timeout=on_timeout, use_signals=use_signals)
+    def f():
+        raise TimeoutError
+
+    assert f() == 0
+
+
 def test_timeout_with_args(use_signals):
     @timeout(
         seconds=TIMEOUT,
@@ -282,6 +382,97 @@ def test_timeout_pickle_error():
 # fmt: on
 
 
+@pytest.mark.parametrize("direct_fork", [True, False])
+def test_timeout_process_direct_fork(monkeypatch, direct_fork):
+    """Test both the direct fork and the multiprocessing.Process path.
+
+    Only the path taken by _Timeout is switched, the process is started
+    with the default start method either way.
+    """
+    start_method = "fork" if direct_fork else "not fork"
+    monkeypatch.setattr(multiprocessing, "get_start_method", lambda: start_method)
+
+    @timeout(seconds=0.3, use_signals=False)
+    def f(i):
+        time.sleep(i)
+        return i
+
+    assert f(0) == 0
+    with pytest.raises(TimeoutError):
+        f(0.5)
+
+
+def test_timeout_process_inherited_queue():
+    result_queue = multiprocessing.Queue()
+    result_queue.put("parent")
+    assert result_queue.get(timeout=2) == "parent"
+
+    @timeout(seconds=2, use_signals=False)
+    def f():
+        result_queue.put("child")
+
+    f()
+    assert result_queue.get(timeout=2) == "child"
+
+
+def test_timeout_process_inherited_queue_large_put():
+    result_queue = multiprocessing.Queue()
+    payload = b"x" * (1 << 20)
+
+    @timeout(seconds=2, use_signals=False)
+    def f():
+        result_queue.put(payload)
+
+    start = time.perf_counter()
+    f()
+    assert time.perf_counter() - start < 2
+    assert result_queue.get(timeout=2) == payload
+
+
+def test_timeout_process_exit_without_result():
+    @timeout(use_signals=False)
+    def f():
+        os._exit(1)
+
+    with pytest.raises(TimeoutError):
+        f()
+
+
+def test_timeout_thread_unpicklable_result():
+    @timeout(seconds=TIMEOUT, use_signals="thread")
+    def f():
+        class Test:
+            pass
+
+        return Test()
+
+    assert f().__class__.__name__ == "Test"
+
+
+def test_timeout_thread_system_exit():
+    @timeout(seconds=1, use_signals="thread")
+    def f():
+        sys.exit(3)
+
+    with pytest.raises(SystemExit):
+        f()
+
+
+def test_timeout_thread_stops_function():
+    finished = []
+
+    @timeout(seconds=TIMEOUT, use_signals="thread")
+    def f():
+        for _ in range(10):
+            time.sleep(TIMEOUT / 2)
+        finished.append(True)
+
+    with pytest.raises(TimeoutError):
+        f()
+    time.sleep(10 * TIMEOUT / 2)
+    assert not finished
+
+
 def test_timeout_non_exception_types_raise_exception(use_signals):
     with pytest.raises(
         TypeError, match="^exception_type must be a subclass of Exception$"
@@ -292,6 +483,14 @@ def test_timeout_non_exception_types_raise_exception(use_signals):
             pass
 
 
+def test_timeout_unknown_use_signals_raise_exception():
+    with pytest.raises(ValueError, match='^use_signals must be a bool or "thread"$'):
+
+        @timeout(seconds=TIMEOUT, use_signals="threads")
+        def f():
+            pass
+
+
 def test_timeout_negative_retries_raise_exception(use_signals):
     with pytest.raises(
         ValueError, match="^retries must be greater than or equal to 0$"
@@ -310,6 +509,14 @@ def test_timeout_non_int_retries_raise_exception(use_signals):
             pass
 
 
+def test_timeout_bool_retries_raise_exception():
+    with pytest.raises(TypeError, match="^retries must be an integer$"):
+
+        @timeout(seconds=TIMEOUT, retries=True)
+        def f():
+            pass
+
+
 def test_timeout_custom_exception_message():
     @timeout(seconds=TIMEOUT, exception_message=EXCEPTION_MESSAGE)
     def f():
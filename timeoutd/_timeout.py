@@ -1,37 +1,113 @@
-"""This module contains the class used to wrap a multithreaded function."""
+"""This module contains the classes used to wrap a multithreaded function."""
 
 from __future__ import annotations
 
+import contextlib
+import ctypes
 import multiprocessing
+import os
+import signal
 import sys
+import threading
 import time
-from typing import Callable
+import traceback
+from multiprocessing import util
+from multiprocessing.connection import Connection
+from typing import Callable, NoReturn
 
 from timeoutd.exceptions import raise_exception
 
 
-def _target(queue, function, *args, **kwargs) -> None:
-    """Run a function with arguments and return output via a queue.
+def _target(connection, function, *args, **kwargs) -> None:
+    """Run a function with arguments and return output via a pipe.
 
     This is a helper function for the Process created in _Timeout. It
     runs the function with positional arguments and keyword arguments
-    and then returns the function's output by way of a queue. If an
-    exception gets raised, it is returned to _Timeout to be raised by
-    the value property.
+    and then returns the function's output by way of a pipe. If an
+    exception gets raised, it is returned to _Timeout to be raised in
+    the calling process. If the output cannot be pickled, nothing is
+    sent and the process exits.
     """
     try:
-        queue.put((True, function(*args, **kwargs)))
+        result = (True, function(*args, **kwargs))
     except Exception:  # pylint: disable=broad-except
-        queue.put((False, sys.exc_info()[1]))
+        result = (False, sys.exc_info()[1])
+    connection.send(result)
+
+
+def _flush_std_streams() -> None:
+    """Flush stdout and stderr so buffered output is not written twice."""
+    for stream in (sys.stdout, sys.stderr):
+        with contextlib.suppress(AttributeError, ValueError):
+            stream.flush()
+
+
+def _fork_target(connection, function, args: tuple, kwargs: dict) -> NoReturn:
+    """Run _target in a forked child and exit the child afterwards.
+
+    Like a forked multiprocessing.Process, the child drops the parent's
+    finalizers and runs the after fork hooks, so inherited
+    multiprocessing objects such as queues keep working. The child must
+    never return into the stack it inherited from the parent, so it
+    always leaves through os._exit, which skips the interpreter
+    shutdown. Hence the finalizers, which e.g. flush queues, are run and
+    the output is flushed explicitly.
+    """
+    code = 0
+    try:
+        # pylint: disable=protected-access
+        util._finalizer_registry.clear()  # type: ignore[attr-defined]
+        util._run_after_forkers()  # type: ignore[attr-defined]
+        try:
+            _target(connection, function, *args, **kwargs)
+        finally:
+            util._run_finalizers()  # type: ignore[attr-defined]
+    except BaseException:  # pylint: disable=broad-except
+        traceback.print_exc()
+        code = 1
+    finally:
+        _flush_std_streams()
+        os._exit(code)
+
+
+def _deadline(limit: float | None) -> float | None:
+    """Turn a time limit into a time.perf_counter() based deadline.
+
+    The deadline is taken before the child is started, so the start up
+    time counts against the limit.
+    """
+    if not limit:
+        return None
+    return time.perf_counter() + limit
+
+
+def _kill(pid: int) -> None:
+    """Kill and reap a child created by os.fork()."""
+    os.kill(pid, signal.SIGKILL)
+    os.waitpid(pid, 0)
+
+
+def _reap(pid: int) -> None:
+    """Reap a child created by os.fork() without waiting for it.
+
+    After delivering its result, the child may still run finalizers,
+    e.g. join the feeder thread of an inherited queue that only drains
+    once the caller reads from it. If the child has not exited yet, it
+    is reaped by a daemon thread instead of blocking the caller.
+    """
+    with contextlib.suppress(ChildProcessError):
+        if os.waitpid(pid, os.WNOHANG)[0] == 0:
+            threading.Thread(target=os.waitpid, args=(pid, 0), daemon=True).start()
 
 
 class _Timeout:
     """Wrap a function and add a timeout (limit) attribute to it.
 
-    Instances of this class are automatically generated by the
-    add_timeout function defined above. Wrapping a function allows
-    asynchronous calls to be made and termination of execution after a
-    timeout has passed.
+    Instances of this class are generated once per decorated function by
+    the timeout_handler. Wrapping a function allows asynchronous calls
+    to be made and termination of execution after a timeout has passed.
+    All state of a single call is kept local to that call, so an
+    instance can be shared by concurrent and recursive calls.
 
     :param function: function to wrap
     :type function: Callable
@@ -44,68 +120,229 @@ class _Timeout:
     :param limit: optional time limit in seconds or fractions of a
         second. If None is passed, no timeout is applied.
     :type limit: float
+    :param allow_override: flag indicating whether the limit can be
+        overridden per call with a `timeout` keyword argument.
+    :type allow_override: bool
     """
 
+    __slots__ = (
+        "__limit",
+        "__allow_override",
+        "__function",
+        "__exception_type",
+        "__exception_message",
+    )
+
     def __init__(
         self,
         function: Callable,
         exception_type: type,
         exception_message: str | None,
         limit: float | None,
+        allow_override: bool = True,
     ):
         """Initialize instance in preparation for being called."""
         self.__limit = limit
+        self.__allow_override = allow_override
         self.__function = function
         self.__exception_type = exception_type
         self.__exception_message = exception_message
-        self.__name__ = function.__name__
-        self.__doc__ = function.__doc__
-        self.__timeout = time.time()
-        self.__process = multiprocessing.Process()
-        self.__queue: multiprocessing.Queue = multiprocessing.Queue()
 
     def __call__(self, *args, **kwargs):
         """Execute the embedded function object asynchronously.
 
         The function given to the constructor is transparently called
-        and requires that "ready" be intermittently polled. If and when
-        it is True, the "value" property may then be checked for
-        returned data.
+        in a separate process. Where multiprocessing uses the fork start
+        method, the process is forked directly, otherwise a
+        multiprocessing.Process is started. The call blocks until either
+        the process delivered its result or the time limit is reached,
+        in which case the process is terminated and the exception is
+        raised. The exception is raised as well if the process exits
+        without delivering a result, e.g. because it could not be
+        pickled.
         """
-        self.__limit = kwargs.pop("timeout", self.__limit)
-        self.__queue = multiprocessing.Queue(1)
-        args = (self.__queue, self.__function) + args
-        self.__process = multiprocessing.Process(
-            target=_target, args=args, kwargs=kwargs
-        )
-        self.__process.daemon = True
-        self.__process.start()
-        if self.__limit is not None:
-            self.__timeout = self.__limit + time.time()
-        while not self.ready:
-            time.sleep(0.01)
-        return self.value
-
-    def cancel(self):
+        limit = self.__limit
+        if self.__allow_override:
+            limit = kwargs.pop("timeout", limit)
+        if multiprocessing.get_start_method() == "fork":
+            flag, load = self._call_forked(args, kwargs, limit)
+        else:
+            flag, load = self._call_process(args, kwargs, limit)
+        if flag:
+            return load
+        raise load
+
+    def _call_forked(self, args: tuple, kwargs: dict, limit: float | None) -> tuple:
+        """Run the function in a child created directly with os.fork().
+
+        This skips the bookkeeping of multiprocessing.Process, which is
+        only used where multiprocessing would not fork anyway.
+        """
+        deadline = _deadline(limit)
+        reader, writer = multiprocessing.Pipe(duplex=False)
+        _flush_std_streams()
+        pid = os.fork()
+        if pid == 0:
+            _fork_target(writer, self.__function, args, kwargs)
+        # only the child writes, closing our end lets a dying child
+        # show up as end of file instead of blocking until the deadline
+        writer.close()
+        try:
+            result = self._wait_and_fetch(reader, deadline)
+        except BaseException:
+            _kill(pid)
+            raise
+        if result is None:
+            _kill(pid)
+            raise_exception(self.__exception_type, self.__exception_message)
+        _reap(pid)
+        return result
+
+    def _call_process(self, args: tuple, kwargs: dict, limit: float | None) -> tuple:
+        """Run the function in a multiprocessing.Process."""
+        deadline = _deadline(limit)
+        reader, writer = multiprocessing.Pipe(duplex=False)
+        args = (writer, self.__function) + args
+        process = multiprocessing.Process(target=_target, args=args, kwargs=kwargs)
+        process.daemon = True
+        process.start()
+        # only the child writes, closing our end lets a dying child
+        # show up as end of file instead of blocking until the deadline
+        writer.close()
+        result = self._wait_and_fetch(reader, deadline)
+        if result is None:
+            self.cancel(process)
+        return result
+
+    @staticmethod
+    def _wait_and_fetch(reader: Connection, deadline: float | None) -> tuple | None:
+        """Block until the child delivered its result or the deadline.
+
+        None is returned if no result could be fetched in time.
+        """
+        remaining = None
+        if deadline is not None:
+            remaining = max(deadline - time.perf_counter(), 0)
+        with reader:
+            try:
+                if reader.poll(remaining):
+                    return reader.recv()
+            except EOFError:
+                pass
+        return None
+
+    def cancel(self, process: multiprocessing.Process) -> NoReturn:
         """Terminate any possible execution of the embedded function."""
-        if self.__process.is_alive():
-            self.__process.terminate()
+        if process.is_alive():
+            process.terminate()
+            process.join(0.1)
 
         raise_exception(self.__exception_type, self.__exception_message)
 
-    @property
-    def ready(self):
-        """Read-only property indicating status of "value" property."""
-        if self.__limit and self.__timeout < time.time():
-            self.cancel()
-        return self.__queue.full() and not self.__queue.empty()
-
-    @property
-    def value(self):
-        """Read-only property containing data returned from function."""
-        if self.ready is True:
-            flag, load = self.__queue.get()
-            if flag:
-                return load
-            raise load
-        return None
+
+def _thread_target(result: list, function, *args, **kwargs) -> None:
+    """Run a function with arguments and return output via a list.
+
+    This is a helper function for the Thread created in _ThreadTimeout.
+    The function's output, or the exception it raised, is appended to
+    the result list to be returned or raised in the calling thread. This
+    includes exceptions like SystemExit, so a thread that ended is never
+    mistaken for a timeout.
+    """
+    try:
+        result.append((True, function(*args, **kwargs)))
+    except BaseException:  # pylint: disable=broad-except
+        result.append((False, sys.exc_info()[1]))
+
+
+def _async_raise(thread: threading.Thread, exception_type: type) -> None:
+    """Asynchronously raise an exception in another thread.
+
+    The exception is raised as soon as the thread executes the next
+    Python bytecode, so blocking calls into C code are not interrupted.
+    """
+    if thread.ident is None:
+        return
+    ident = ctypes.c_ulong(thread.ident)
+    modified = ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ident, ctypes.py_object(exception_type)
+    )
+    if modified > 1:
+        # undo the request if more than one thread state was hit
+        ctypes.pythonapi.PyThreadState_SetAsyncExc(ident, None)
+
+
+class _ThreadTimeout:
+    """Wrap a function and run it in a thread with a timeout.
+
+    Instances of this class are generated once per decorated function by
+    the timeout_handler. Other than _Timeout, the function runs in a
+    daemon thread of the calling process, so neither the function nor
+    its result needs to be picklable. When the timeout is reached, the
+    exception is raised in the calling thread right away and also
+    injected into the worker thread to stop it.
+
+    :param function: function to wrap
+    :type function: Callable
+    :param exception_type: exception to raise when the timeout is
+        reached.
+    :type exception_type: type
+    :param exception_message: optional message to pass to the exception
+        when the timeout is reached.
+    :type exception_message: str
+    :param limit: optional time limit in seconds or fractions of a
+        second. If None is passed, no timeout is applied.
+    :type limit: float
+    :param allow_override: flag indicating whether the limit can be
+        overridden per call with a `timeout` keyword argument.
+    :type allow_override: bool
+    """
+
+    __slots__ = (
+        "__limit",
+        "__allow_override",
+        "__function",
+        "__exception_type",
+        "__exception_message",
+    )
+
+    def __init__(
+        self,
+        function: Callable,
+        exception_type: type,
+        exception_message: str | None,
+        limit: float | None,
+        allow_override: bool = True,
+    ):
+        """Initialize instance in preparation for being called."""
+        self.__limit = limit
+        self.__allow_override = allow_override
+        self.__function = function
+        self.__exception_type = exception_type
+        self.__exception_message = exception_message
+
+    def __call__(self, *args, **kwargs):
+        """Execute the embedded function object in a separate thread.
+
+        The call blocks until either the thread finished or the time
+        limit is reached, in which case the exception is raised.
+        """
+        limit = self.__limit
+        if self.__allow_override:
+            limit = kwargs.pop("timeout", limit)
+        result: list = []
+        thread = threading.Thread(
+            target=_thread_target,
+            args=(result, self.__function) + args,
+            kwargs=kwargs,
+            daemon=True,
+        )
+        thread.start()
+        thread.join(limit or None)
+        if not result:
+            _async_raise(thread, self.__exception_type)
+            raise_exception(self.__exception_type, self.__exception_message)
+        flag, load = result[0]
+        if flag:
+            return load
+        raise load
@@ -2,7 +2,35 @@
 
 from __future__ import annotations
 
+import time
 from datetime import datetime, timedelta
+from typing import Callable
+
+
+def _datetime_to_seconds(limit: datetime) -> float:
+    """Convert a point in time to the seconds remaining until then.
+
+    Naive datetimes are interpreted as local time, just like the result
+    of datetime.now().
+    """
+    return limit.timestamp() - time.time()
+
+
+def _other_to_seconds(limit) -> float:
+    """Convert subclasses of the supported types and other numbers."""
+    if isinstance(limit, datetime):
+        return _datetime_to_seconds(limit)
+    if isinstance(limit, timedelta):
+        return limit.total_seconds()
+    return float(limit)
+
+
+_CONVERTERS: dict[type, Callable[..., float]] = {
+    float: float,
+    int: float,
+    datetime: _datetime_to_seconds,
+    timedelta: timedelta.total_seconds,
+}
 
 
 def time_to_seconds(
@@ -12,17 +40,11 @@ def time_to_seconds(
     minutes: float | None = None,
     hours: float | None = None,
 ) -> float:
-    """Convert time to seconds."""
+    """Convert time to seconds.
+
+    If a limit is given, it takes precedence over the seconds, minutes,
+    and hours.
+    """
     if limit is not None:
-        if isinstance(limit, datetime):
-            return (limit - datetime.now()).total_seconds()
-        if isinstance(limit, timedelta):
-            return limit.total_seconds()
-        return limit
-    if seconds is None:
-        seconds = 0
-    if minutes is None:
-        minutes = 0
-    if hours is None:
-        hours = 0
-    return seconds + (minutes * 60) + (hours * 3600)
+        return _CONVERTERS.get(type(limit), _other_to_seconds)(limit)
+    return (seconds or 0.0) + (minutes or 0.0) * 60 + (hours or 0.0) * 3600
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from typing import NoReturn
 
-def raise_exception(exception: type, exception_message: str | None):
+
+def raise_exception(exception: type, exception_message: str | None) -> NoReturn:
     """This function checks if a exception message is given.
 
     If there is no exception message, the default behavior is
@@ -4,24 +4,158 @@ from __future__ import annotations
 
 import contextlib
 import signal
-from functools import wraps
+from functools import WRAPPER_ASSIGNMENTS, partial, update_wrapper
 from typing import Callable
 
-from timeoutd._timeout import _Timeout
-from timeoutd.exceptions import raise_exception
+from timeoutd._timeout import _ThreadTimeout, _Timeout
+
+_LIGHT_ASSIGNMENTS = ("__name__", "__qualname__", "__doc__")
+_REMAINING_ASSIGNMENTS = tuple(
+    name for name in WRAPPER_ASSIGNMENTS if name not in _LIGHT_ASSIGNMENTS
+)
+
+
+def _light_wraps(function: Callable, wrapper: Callable) -> Callable:
+    """Name a wrapper after the function it wraps.
+
+    This is a cheaper functools.wraps for the layers of a decorated
+    function, copying only the attributes used to introspect it.
+
+    :param function: wrapped function
+    :type function: Callable
+    :param wrapper: wrapper function
+    :type wrapper: Callable
+    :return: the wrapper
+    """
+    for name in _LIGHT_ASSIGNMENTS:
+        # like functools.wraps, skip attributes callables such as
+        # partial objects or instances do not have
+        with contextlib.suppress(AttributeError):
+            setattr(wrapper, name, getattr(function, name))
+    wrapper.__wrapped__ = function  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _make_fused_wrapper(
+    function: Callable,
+    *,
+    seconds: float | None,
+    use_signals: bool | str,
+    exception_type: type,
+    exception_message: str | None,
+    on_timeout: Callable | None,
+    on_timeout_args: tuple,
+    on_timeout_kwargs: dict,
+    retries: int,
+    allow_override: bool,
+) -> Callable:
+    """Build the wrapper for the given configuration.
+
+    The common configurations, a plain timeout and a timeout with an
+    on_timeout function, are served by a single wrapper. Only retries
+    are composed out of the individual handlers. The layers are named
+    after the function with _light_wraps and only the outermost one
+    receives the remaining attributes functools.wraps would copy.
+
+    :param function: function to wrap
+    :type function: Callable
+    :param seconds: optional time limit in seconds or fractions of a
+        second. If None is passed, no timeout is applied.
+    :type seconds: float
+    :param use_signals: flag indicating whether signals should be used
+        for timing function out or the multiprocessing. If "thread" is
+        passed, the function is run in a thread instead.
+    :type use_signals: bool | str
+    :param exception_type: exception to raise when the timeout is
+        reached.
+    :type exception_type: type
+    :param exception_message: optional message to pass to the exception
+        when the timeout is reached.
+    :param on_timeout: optional function to call when the timeout is
+        reached instead of raising an exception.
+    :type on_timeout: Callable | None
+    :param on_timeout_args: arguments to pass to the on_timeout
+        function.
+    :type on_timeout_args: tuple
+    :param on_timeout_kwargs: keyword arguments to pass to the
+        on_timeout function.
+    :type on_timeout_kwargs: dict
+    :param retries: number of retries
+    :type retries: int
+    :param allow_override: flag indicating whether the time limit can
+        be overridden per call with a `timeout` keyword argument.
+    :type allow_override: bool
+    :return: wrapped function
+    """
+    bound_on_timeout = on_timeout
+    if on_timeout is not None and (on_timeout_args or on_timeout_kwargs):
+        bound_on_timeout = partial(on_timeout, *on_timeout_args, **on_timeout_kwargs)
+
+    wrapper = None
+    if bound_on_timeout is not None and not retries:
+        if not _uses_signals(use_signals):
+            timeout_wrapper = _new_timeout_wrapper(
+                function,
+                seconds=seconds,
+                use_signals=use_signals,
+                exception_type=exception_type,
+                exception_message=exception_message,
+                allow_override=allow_override,
+            )
+            wrapper = _light_wraps(
+                function,
+                _exception_handler_noargs(
+                    timeout_wrapper, bound_on_timeout, exception_type
+                ),
+            )
+        elif seconds:
+            wrapper = _make_fused_signal_wrapper(
+                function,
+                seconds,
+                _make_signal_handler(exception_type, exception_message),
+                exception_type,
+                bound_on_timeout,
+                allow_override,
+            )
+
+    if wrapper is None:
+        wrapper = timeout_handler(
+            function,
+            seconds,
+            use_signals,
+            exception_type,
+            exception_message,
+            allow_override,
+        )
+        if bound_on_timeout is None and retries:
+            # without on_timeout, the timed function itself is retried
+            bound_on_timeout = partial(wrapper, *on_timeout_args, **on_timeout_kwargs)
+        if bound_on_timeout is not None:
+            wrapper = _exception_handler_noargs(
+                wrapper, bound_on_timeout, exception_type
+            )
+        if retries:
+            wrapper = retry_handler(wrapper, retries=retries)
+
+    if wrapper is not function:
+        # the layers only copied what _light_wraps copies
+        update_wrapper(wrapper, function, assigned=_REMAINING_ASSIGNMENTS)
+    return wrapper
 
 
 def timeout_handler(
     function: Callable,
     seconds: float | None,
-    use_signals: bool,
+    use_signals: bool | str,
     exception_type: type,
     exception_message: str | None,
+    allow_override: bool = True,
 ) -> Callable:
     """This function checks if signals should be used for timing out.
 
     If the use_signals flag is set to True, the signaler is used. If the
-    flag is set to False, the multiprocessing is used.
+    flag is set to False, the multiprocessing is used. If it is set to
+    "thread", the function is run in a thread.
 
     :param function: function to wrap
     :type function: Callable
@@ -31,96 +165,303 @@ def timeout_handler(
         out depending on the settings.
     :type seconds: float
     :param use_signals: flag indicating whether signals should be used
-        for timing function out or the multiprocessing.
-        When using multiprocessing, timeout granularity is limited to
-        10ths of a second.
-    :type use_signals: bool
+        for timing function out or the multiprocessing. If "thread" is
+        passed, the function is run in a thread instead.
+    :type use_signals: bool | str
     :param exception_type: exception to raise when the timeout is
         reached.
     :type exception_type: type
     :param exception_message: optional message to pass to the exception
         when the timeout is reached.
+    :param allow_override: flag indicating whether the time limit can
+        be overridden per call with a `timeout` keyword argument.
+    :type allow_override: bool
 
     :return: wrapped function
 
     :raises: TimeoutError if time limit is reached.
     """
-    if use_signals:
+    if _uses_signals(use_signals):
+        handler = _make_signal_handler(exception_type, exception_message)
+        if seconds:
+            return _make_fast_signal_wrapper(function, seconds, handler, allow_override)
+        if allow_override:
+            return _make_dynamic_signal_wrapper(function, handler)
+        return function
 
-        def handler(*args, **kwargs):  # pylint: disable=unused-argument
-            raise_exception(exception_type, exception_message)
+    timeout_wrapper = _new_timeout_wrapper(
+        function,
+        seconds=seconds,
+        use_signals=use_signals,
+        exception_type=exception_type,
+        exception_message=exception_message,
+        allow_override=allow_override,
+    )
 
-        @wraps(function)
-        def new_function(*args, **kwargs):
-            new_seconds = kwargs.pop("timeout", seconds)
-            if new_seconds:
-                old_handler = signal.signal(signal.SIGALRM, handler)
-                signal.setitimer(signal.ITIMER_REAL, new_seconds)
+    def new_mt_function(*args, **kwargs):
+        return timeout_wrapper(*args, **kwargs)
 
-            if not seconds:
-                return function(*args, **kwargs)
+    return _light_wraps(function, new_mt_function)
 
-            try:
-                return function(*args, **kwargs)
-            finally:
-                if new_seconds:
-                    signal.setitimer(signal.ITIMER_REAL, 0)
-                    # reinstall the old signal handler
-                    signal.signal(signal.SIGALRM, old_handler)
 
-        return new_function
+def _uses_signals(use_signals: bool | str) -> bool:
+    """Check if the use_signals flag selects the signal based timeout."""
+    return bool(use_signals) and use_signals != "thread"
 
-    @wraps(function)
-    def new_mt_function(*args, **kwargs):
-        timeout_wrapper = _Timeout(
+
+def _new_timeout_wrapper(
+    function: Callable,
+    *,
+    seconds: float | None,
+    use_signals: bool | str,
+    exception_type: type,
+    exception_message: str | None,
+    allow_override: bool,
+) -> _Timeout | _ThreadTimeout:
+    """Create the wrapper running the function in a process or thread.
+
+    :param function: function to wrap
+    :type function: Callable
+    :param seconds: optional time limit in seconds or fractions of a
+        second. If None is passed, no timeout is applied.
+    :type seconds: float
+    :param use_signals: "thread" to run the function in a thread, any
+        other value to run it in a process.
+    :type use_signals: bool | str
+    :param exception_type: exception to raise when the timeout is
+        reached.
+    :type exception_type: type
+    :param exception_message: optional message to pass to the exception
+        when the timeout is reached.
+    :param allow_override: flag indicating whether the time limit can
+        be overridden per call with a `timeout` keyword argument.
+    :type allow_override: bool
+    :return: _Timeout or _ThreadTimeout instance
+    """
+    if use_signals == "thread":
+        return _ThreadTimeout(
             function=function,
             exception_type=exception_type,
             exception_message=exception_message,
             limit=seconds,
+            allow_override=allow_override,
         )
-        return timeout_wrapper(*args, **kwargs)
+    return _Timeout(
+        function=function,
+        exception_type=exception_type,
+        exception_message=exception_message,
+        limit=seconds,
+        allow_override=allow_override,
+    )
+
+
+def _make_signal_handler(
+    exception_type: type,
+    exception_message: str | None,
+) -> Callable:
+    """Create a SIGALRM handler raising the timeout exception.
+
+    :param exception_type: exception to raise when the timeout is
+        reached.
+    :type exception_type: type
+    :param exception_message: optional message to pass to the exception
+        when the timeout is reached.
+    :return: signal handler
+    """
+    if exception_message is None:
+
+        def handler_no_msg(*args, **kwargs):  # pylint: disable=unused-argument
+            raise exception_type()
+
+        return handler_no_msg
 
-    return new_mt_function
+    def handler_with_msg(*args, **kwargs):  # pylint: disable=unused-argument
+        raise exception_type(exception_message)
 
+    return handler_with_msg
 
-def exception_handler(
+
+def _make_fused_signal_wrapper(
+    function: Callable,
+    seconds: float,
+    handler: Callable,
+    exception_type: type,
+    on_timeout: Callable,
+    allow_override: bool,
+) -> Callable:
+    """Wrap a function with a signal based timeout and an on_timeout call.
+
+    The timer is disarmed and the old signal handler is reinstalled
+    before on_timeout is called, so on_timeout itself is not timed out.
+
+    :param function: function to wrap
+    :type function: Callable
+    :param seconds: time limit in seconds or fractions of a second.
+    :type seconds: float
+    :param handler: signal handler raising the timeout exception.
+    :type handler: Callable
+    :param exception_type: exception to catch.
+    :type exception_type: type
+    :param on_timeout: function to call without arguments when the
+        timeout is reached.
+    :type on_timeout: Callable
+    :param allow_override: flag indicating whether the time limit can
+        be overridden per call with a `timeout` keyword argument.
+    :type allow_override: bool
+    :return: wrapped function
+    """
+    # bind the signal functions and constants to the closure
+    set_handler, setitimer = signal.signal, signal.setitimer
+    sigalrm, itimer_real = signal.SIGALRM, signal.ITIMER_REAL
+
+    if allow_override:
+
+        def new_function(*args, **kwargs):
+            new_seconds = kwargs.pop("timeout", seconds) or 0
+            old_handler = set_handler(sigalrm, handler)
+            setitimer(itimer_real, new_seconds)
+            try:
+                return function(*args, **kwargs)
+            except exception_type:
+                pass
+            finally:
+                setitimer(itimer_real, 0)
+                # reinstall the old signal handler
+                set_handler(sigalrm, old_handler)
+            return on_timeout()
+
+        return _light_wraps(function, new_function)
+
+    def new_fixed_function(*args, **kwargs):
+        old_handler = set_handler(sigalrm, handler)
+        setitimer(itimer_real, seconds)
+        try:
+            return function(*args, **kwargs)
+        except exception_type:
+            pass
+        finally:
+            setitimer(itimer_real, 0)
+            # reinstall the old signal handler
+            set_handler(sigalrm, old_handler)
+        return on_timeout()
+
+    return _light_wraps(function, new_fixed_function)
+
+
+def _make_fast_signal_wrapper(
+    function: Callable,
+    seconds: float,
+    handler: Callable,
+    allow_override: bool,
+) -> Callable:
+    """Wrap a function with a signal based timeout that is always armed.
+
+    This wrapper is used when a time limit is given at decoration time,
+    so the timer is set on every call without any further checks. If
+    overriding is allowed, a falsy `timeout` keyword argument disarms
+    the timer for that call. Otherwise the keyword arguments are passed
+    on untouched.
+
+    :param function: function to wrap
+    :type function: Callable
+    :param seconds: time limit in seconds or fractions of a second.
+    :type seconds: float
+    :param handler: signal handler raising the timeout exception.
+    :type handler: Callable
+    :param allow_override: flag indicating whether the time limit can
+        be overridden per call with a `timeout` keyword argument.
+    :type allow_override: bool
+    :return: wrapped function
+    """
+    set_handler, setitimer = signal.signal, signal.setitimer
+    sigalrm, itimer_real = signal.SIGALRM, signal.ITIMER_REAL
+
+    if allow_override:
+
+        def new_function(*args, **kwargs):
+            new_seconds = kwargs.pop("timeout", seconds) or 0
+            old_handler = set_handler(sigalrm, handler)
+            setitimer(itimer_real, new_seconds)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                setitimer(itimer_real, 0)
+                # reinstall the old signal handler
+                set_handler(sigalrm, old_handler)
+
+        return _light_wraps(function, new_function)
+
+    def new_fixed_function(*args, **kwargs):
+        old_handler = set_handler(sigalrm, handler)
+        setitimer(itimer_real, seconds)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            setitimer(itimer_real, 0)
+            # reinstall the old signal handler
+            set_handler(sigalrm, old_handler)
+
+    return _light_wraps(function, new_fixed_function)
+
+
+def _make_dynamic_signal_wrapper(
+    function: Callable,
+    handler: Callable,
+) -> Callable:
+    """Wrap a function with a signal based timeout set per call.
+
+    This wrapper is used when no time limit is given at decoration time.
+    The function is called directly unless a `timeout` keyword argument
+    is passed.
+
+    :param function: function to wrap
+    :type function: Callable
+    :param handler: signal handler raising the timeout exception.
+    :type handler: Callable
+    :return: wrapped function
+    """
+    set_handler, setitimer = signal.signal, signal.setitimer
+    sigalrm, itimer_real = signal.SIGALRM, signal.ITIMER_REAL
+
+    def new_function(*args, **kwargs):
+        new_seconds = kwargs.pop("timeout", None)
+        if not new_seconds:
+            return function(*args, **kwargs)
+
+        old_handler = set_handler(sigalrm, handler)
+        setitimer(itimer_real, new_seconds)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            setitimer(itimer_real, 0)
+            # reinstall the old signal handler
+            set_handler(sigalrm, old_handler)
+
+    return _light_wraps(function, new_function)
+
+
+def _exception_handler_noargs(
     function: Callable,
     on_timeout: Callable,
-    *,
     exception_type: type,
-    on_timeout_args: tuple | None,
-    on_timeout_kwargs: dict | None,
 ) -> Callable:
-    """This function catches the exception and calls the on_timeout function.
+    """Catch the exception and call on_timeout without any arguments.
 
     :param function: function to wrap
     :type function: Callable
     :type on_timeout: Callable
-    :param exception_type: optional exception to raise when the timeout
-        is reached. If None is passed, the default behavior is to raise
-        a TimeoutError exception.
+    :param exception_type: exception to catch.
     :type exception_type: type
-    :param on_timeout_args: optional arguments to pass to the on_timeout
-        function.
-    :type on_timeout_args: tuple
-    :param on_timeout_kwargs: optional keyword arguments to pass to the
-        on_timeout function.
-    :type on_timeout_kwargs: dict
     :return: wrapped function
     """
-    if on_timeout_args is None:
-        on_timeout_args = ()
-    if on_timeout_kwargs is None:
-        on_timeout_kwargs = {}
 
-    @wraps(function)
     def new_function(*args, **kwargs):
         try:
             return function(*args, **kwargs)
         except exception_type:
-            return on_timeout(*on_timeout_args, **on_timeout_kwargs)
+            return on_timeout()
 
-    return new_function
+    return _light_wraps(function, new_function)
 
 
 def retry_handler(
@@ -136,11 +477,10 @@ def retry_handler(
     :return: wrapped function
     """
 
-    @wraps(function)
     def new_function(*args, **kwargs):
         for _ in range(retries):
             with contextlib.suppress(Exception):
                 return function(*args, **kwargs)
         return function(*args, **kwargs)
 
-    return new_function
+    return _light_wraps(function, new_function)
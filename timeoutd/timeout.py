@@ -6,7 +6,7 @@ from datetime import datetime, timedelta
 from typing import Callable
 
 from timeoutd.converters import time_to_seconds
-from timeoutd.handlers import exception_handler, retry_handler, timeout_handler
+from timeoutd.handlers import _make_fused_wrapper
 
 
 def timeout(
@@ -17,11 +17,12 @@ def timeout(
     hours: float | None = None,
     on_timeout: Callable | None = None,
     retries: int | None = None,
-    use_signals: bool = True,
+    use_signals: bool | str = True,
     exception_type: type = TimeoutError,
     exception_message: str | None = None,
     on_timeout_args: tuple | None = None,
     on_timeout_kwargs: dict | None = None,
+    allow_override: bool = True,
 ) -> Callable:
     """Add a timeout parameter to a function and return it.
 
@@ -57,10 +58,13 @@ def timeout(
         See the `limit` parameter for more information.
     :type hours: float | None
     :param use_signals: flag indicating whether signals should be used
-        for timing function out or the multiprocessing.
-        When using multiprocessing, timeout granularity is limited to
-        10ths of a second.
-    :type use_signals: bool
+        for timing function out or the multiprocessing. If "thread" is
+        passed, the function is run in a daemon thread of the calling
+        process instead. This neither requires the function and its
+        result to be picklable nor the main thread, but the function
+        is only stopped once it executes Python code again. Any other
+        string raises a ValueError.
+    :type use_signals: bool | str
     :param exception_type: optional exception to raise when the timeout
         is reached. If None is passed, the default behavior is to raise
         a TimeoutError exception.
@@ -73,6 +77,12 @@ def timeout(
     :param on_timeout_kwargs: optional keyword arguments to pass to the
         on_timeout function.
     :type on_timeout_kwargs: dict
+    :param allow_override: flag indicating whether the time limit can
+        be overridden per call by passing a `timeout` keyword argument
+        to the decorated function. If False, a `timeout` keyword
+        argument is passed on to the decorated function and the keyword
+        arguments are not inspected on every call.
+    :type allow_override: bool
 
     :return: wrapped function
 
@@ -83,58 +93,35 @@ def timeout(
     """
     if not issubclass(exception_type, Exception):
         raise TypeError("exception_type must be a subclass of Exception")
+    if isinstance(use_signals, str) and use_signals != "thread":
+        raise ValueError('use_signals must be a bool or "thread"')
 
     seconds = time_to_seconds(
         limit=limit, seconds=seconds, minutes=minutes, hours=hours
     )
 
     _retries = retries if retries is not None else 0
+    if not isinstance(_retries, int) or isinstance(_retries, bool):
+        raise TypeError("retries must be an integer")
     if _retries < 0:
         raise ValueError("retries must be greater than or equal to 0")
-    if not isinstance(_retries, int):
-        raise TypeError("retries must be an integer")
+
+    _on_timeout_args = on_timeout_args or ()
+    _on_timeout_kwargs = on_timeout_kwargs or {}
 
     def decorate(function: Callable) -> Callable:
         """Decorate a function with a timeout."""
-        handled_timeout = timeout_handler(
+        return _make_fused_wrapper(
             function,
             seconds=seconds,
             use_signals=use_signals,
             exception_type=exception_type,
             exception_message=exception_message,
-        )
-
-        if _retries == 0:
-            if on_timeout is None:
-                return handled_timeout
-            return exception_handler(
-                handled_timeout,
-                on_timeout=on_timeout,
-                exception_type=exception_type,
-                on_timeout_args=on_timeout_args,
-                on_timeout_kwargs=on_timeout_kwargs,
-            )
-
-        if on_timeout is None:
-            return retry_handler(
-                exception_handler(
-                    handled_timeout,
-                    on_timeout=handled_timeout,
-                    exception_type=exception_type,
-                    on_timeout_args=on_timeout_args,
-                    on_timeout_kwargs=on_timeout_kwargs,
-                ),
-                retries=_retries,
-            )
-        return retry_handler(
-            exception_handler(
-                handled_timeout,
-                on_timeout=on_timeout,
-                exception_type=exception_type,
-                on_timeout_args=on_timeout_args,
-                on_timeout_kwargs=on_timeout_kwargs,
-            ),
+            on_timeout=on_timeout,
+            on_timeout_args=_on_timeout_args,
+            on_timeout_kwargs=_on_timeout_kwargs,
             retries=_retries,
+            allow_override=allow_override,
         )
 
     return decorate